@@ -12,7 +12,8 @@ VR Translation Service Python 集成示例
 
 运行前请确保:
 1. VR翻译服务已启动 (npm run dev)
-2. 安装依赖: pip install aiohttp websockets pillow
+2. 安装依赖: pip install httpx websockets pillow
+3. 可选依赖: pip install opencv-python numpy (更快的图片编码)
 """
 
 import asyncio
@@ -28,6 +29,41 @@ import os
 sys.path.append(os.path.join(os.path.dirname(__file__), '../../sdk/python'))
 from vr_translate_sdk import VRTranslateSDK
 
+# 启动时缓存单调时钟到墙钟的偏移，时间戳计算无需反复读墙钟
+_WALL_OFFSET_NS = time.time_ns() - time.monotonic_ns()
+
+
+def _now_ms():
+    """当前Unix毫秒时间戳（单调时钟+启动偏移）"""
+    return (time.monotonic_ns() + _WALL_OFFSET_NS) // 1_000_000
+
+
+def _resolve_font():
+    """启动时探测一次系统字体，避免每次生成图片都stat文件并重新加载"""
+    try:
+        from PIL import ImageFont
+    except ImportError:
+        return None
+
+    # 在不同系统上尝试不同的字体
+    font_paths = [
+        '/System/Library/Fonts/Arial.ttf',  # macOS
+        'C:/Windows/Fonts/arial.ttf',       # Windows
+        '/usr/share/fonts/truetype/liberation/LiberationSans-Regular.ttf',  # Linux
+    ]
+
+    for font_path in font_paths:
+        if Path(font_path).exists():
+            try:
+                return ImageFont.truetype(font_path, 20)
+            except OSError:
+                continue
+
+    return ImageFont.load_default()
+
+
+_FONT = _resolve_font()
+
 
 class TranslationExample:
     """翻译服务示例类"""
@@ -54,17 +90,27 @@ class TranslationExample:
             ("Bonjour le monde", "fr", "zh-CN")
         ]
         
-        for text, source_lang, target_lang in texts_to_translate:
-            try:
-                print(f"\n📝 翻译: '{text}' ({source_lang} → {target_lang})")
-                result = await self.sdk.translate(text, source_lang, target_lang)
-                
+        # 并发发起所有翻译请求，总耗时约等于最慢一次往返而非各次之和
+        semaphore = asyncio.Semaphore(4)  # 限制并发数，避免触发服务端速率限制
+
+        async def translate_one(text, source_lang, target_lang):
+            async with semaphore:
+                return await self.sdk.translate(text, source_lang, target_lang)
+
+        results = await asyncio.gather(
+            *[translate_one(text, source_lang, target_lang)
+              for text, source_lang, target_lang in texts_to_translate],
+            return_exceptions=True
+        )
+
+        for (text, source_lang, target_lang), result in zip(texts_to_translate, results):
+            print(f"\n📝 翻译: '{text}' ({source_lang} → {target_lang})")
+            if isinstance(result, Exception):
+                print(f"   ❌ 翻译失败: {result}")
+            else:
                 print(f"   原文: {result['original']}")
                 print(f"   译文: {result['translation']}")
                 print(f"   语言: {result['sourceLang']} → {result['targetLang']}")
-                
-            except Exception as e:
-                print(f"   ❌ 翻译失败: {e}")
     
     async def demo_batch_translation(self):
         """演示批量翻译功能"""
@@ -109,11 +155,9 @@ class TranslationExample:
         try:
             # 创建一个简单的文本图片
             image = self.create_text_image("Hello OCR World!", (400, 100))
-            
-            # 转换为base64
-            buffer = io.BytesIO()
-            image.save(buffer, format='PNG')
-            image_bytes = buffer.getvalue()
+
+            # 编码为JPEG字节
+            image_bytes = self.encode_image(image)
             
             print("📷 OCR识别测试图片...")
             result = await self.sdk.ocr(image_bytes)
@@ -142,26 +186,8 @@ class TranslationExample:
             image = Image.new('RGB', size, color='white')
             draw = ImageDraw.Draw(image)
             
-            # 尝试使用系统字体，如果失败则使用默认字体
-            try:
-                # 在不同系统上尝试不同的字体
-                font_paths = [
-                    '/System/Library/Fonts/Arial.ttf',  # macOS
-                    'C:/Windows/Fonts/arial.ttf',       # Windows
-                    '/usr/share/fonts/truetype/liberation/LiberationSans-Regular.ttf',  # Linux
-                ]
-                
-                font = None
-                for font_path in font_paths:
-                    if Path(font_path).exists():
-                        font = ImageFont.truetype(font_path, 20)
-                        break
-                
-                if not font:
-                    font = ImageFont.load_default()
-                    
-            except:
-                font = ImageFont.load_default()
+            # 使用模块加载时解析好的字体，避免重复扫描文件系统
+            font = _FONT if _FONT is not None else ImageFont.load_default()
             
             # 获取文本边界框
             bbox = draw.textbbox((0, 0), text, font=font)
@@ -179,7 +205,25 @@ class TranslationExample:
         except ImportError:
             # 如果PIL不可用，创建一个简单的彩色图片
             return Image.new('RGB', size, color='lightblue')
-    
+
+    def encode_image(self, image):
+        """将PIL图片编码为JPEG字节（OpenCV编码比PIL PNG快一个数量级）"""
+        try:
+            import cv2
+            import numpy as np
+
+            arr = np.asarray(image)[:, :, ::-1]  # RGB → BGR
+            ok, buf = cv2.imencode('.jpg', arr, [int(cv2.IMWRITE_JPEG_QUALITY), 85])
+            if ok:
+                return buf.tobytes()
+        except ImportError:
+            pass
+
+        # OpenCV不可用时回退到PIL编码
+        buffer = io.BytesIO()
+        image.save(buffer, format='JPEG', quality=85)
+        return buffer.getvalue()
+
     async def demo_websocket_communication(self):
         """演示WebSocket实时通信"""
         print("\n" + "="*60)
@@ -206,7 +250,7 @@ class TranslationExample:
             await self.sdk.send_gaze_data({
                 'x': 150,
                 'y': 250,
-                'timestamp': int(time.time() * 1000),
+                'timestamp': _now_ms(),
                 'confidence': 0.92
             })
             
@@ -354,7 +398,10 @@ def main():
                        help='运行完整演示 (默认)')
     
     args = parser.parse_args()
-    
+
+    # 可选：uvloop可用时替换默认事件循环
+    VRTranslateSDK.install_uvloop()
+
     example = TranslationExample()
     
     if args.interactive:
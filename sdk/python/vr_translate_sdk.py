@@ -8,43 +8,102 @@ Author: VR Translation Team
 """
 
 import asyncio
-import base64
+import binascii
 import json
+import random
+import sys
 import time
 from typing import Dict, List, Optional, Union, Callable, Any
-import aiohttp
+import httpx
 import websockets
 import logging
 
+# 优先使用orjson（编解码快3-10x），未安装时回退到标准库json
+try:
+    import orjson
+
+    def _json_dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj)
+
+    _json_loads = orjson.loads
+except ImportError:
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode('utf-8')
+
+    _json_loads = json.loads
+
+# 启动时缓存单调时钟到墙钟的偏移：时间戳由monotonic_ns推导（整数运算、
+# 不读墙钟），同时仍是服务端可对时的Unix毫秒
+_WALL_OFFSET_NS = time.time_ns() - time.monotonic_ns()
+
+
+def _now_ms() -> int:
+    """当前Unix毫秒时间戳（单调时钟+启动偏移）"""
+    return (time.monotonic_ns() + _WALL_OFFSET_NS) // 1_000_000
+
+
+# OpenCV为可选依赖，仅用于客户端OCR图片预处理
+try:
+    import cv2
+    import numpy as np
+except ImportError:
+    cv2 = None
+    np = None
+
 
 class VRTranslateSDK:
     """VR Translation Service Python SDK"""
-    
-    def __init__(self, base_url: str = "http://localhost:8080", 
+
+    # 进程内缓存TTL（秒）：语言列表几乎不变，统计信息短暂缓存即可应付UI轮询
+    _LANGUAGES_TTL = 300.0
+    _STATS_TTL = 5.0
+
+    # 单条翻译自动合并：凑批窗口（秒）和单批上限
+    _BATCH_WINDOW = 0.005
+    _MAX_BATCH = 32
+
+    # 重试退避参数（秒）与重试无意义的客户端错误状态码
+    _BACKOFF_BASE = 0.1
+    _BACKOFF_CAP = 2.0
+    _NON_RETRYABLE_STATUS = frozenset({400, 401, 403, 404, 422})
+
+
+    def __init__(self, base_url: str = "http://localhost:8080",
                  websocket_url: str = "ws://localhost:8081",
-                 timeout: int = 10, retries: int = 3, debug: bool = False):
+                 timeout: int = 10, retries: int = 3, debug: bool = False,
+                 compression: Optional[str] = None):
         """
         初始化SDK
-        
+
         Args:
             base_url: REST API基础URL
             websocket_url: WebSocket服务器URL
             timeout: 请求超时时间（秒）
             retries: 重试次数
             debug: 是否启用调试模式
+            compression: WebSocket压缩算法，默认None（眼动等小消息下
+                permessage-deflate只增加CPU和每连接约64KiB内存开销），
+                需要时传'deflate'开启
         """
         self.config = {
             'base_url': base_url.rstrip('/'),
             'websocket_url': websocket_url,
             'timeout': timeout,
             'retries': retries,
-            'debug': debug
+            'debug': debug,
+            'compression': compression
         }
         
         self.ws = None
         self.ws_listeners = {}
         self.request_id = 0
-        self.session = None
+        self._client = None
+        self._send_q = None
+        self._writer_task = None
+        self._msg_template = {'type': None, 'payload': None, 'id': 0, 'timestamp': 0}
+        self._response_cache = {}
+        self._pending_translations = {}
+        self._background_tasks = set()
         
         # 设置日志
         if debug:
@@ -54,43 +113,136 @@ class VRTranslateSDK:
             self.logger = logging.getLogger('[VRTranslateSDK]')
             self.logger.setLevel(logging.WARNING)
     
+    @classmethod
+    def install_uvloop(cls) -> bool:
+        """
+        安装uvloop事件循环（可选加速）
+
+        uvloop基于libuv，网络系统调用吞吐约有2-4x提升，API完全兼容。
+        需在创建事件循环前调用；Windows或未安装uvloop时静默跳过。
+
+        Returns:
+            是否成功安装
+        """
+        if sys.platform == 'win32':
+            return False
+        try:
+            import uvloop
+        except ImportError:
+            return False
+        uvloop.install()
+        return True
+
     async def __aenter__(self):
         """异步上下文管理器入口"""
-        self.session = aiohttp.ClientSession()
+        self._ensure_client()
         return self
-    
+
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """异步上下文管理器出口"""
         await self.disconnect_websocket()
-        if self.session:
-            await self.session.close()
+        if self._client:
+            await self._client.aclose()
+            self._client = None
+
+    def _ensure_client(self) -> httpx.AsyncClient:
+        """获取（按需创建）长连接HTTP客户端，复用连接池避免每次请求重建TCP/TLS"""
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                base_url=self.config['base_url'],
+                timeout=self.config['timeout'],
+                limits=httpx.Limits(max_keepalive_connections=32, max_connections=64)
+            )
+        return self._client
     
     # ===============================
     # REST API方法
     # ===============================
     
-    async def translate(self, text: str, source_lang: str = 'auto', 
+    async def translate(self, text: str, source_lang: str = 'auto',
                        target_lang: str = 'zh-CN') -> Dict[str, Any]:
         """
         翻译文本
-        
+
+        并发的单条调用会在一个短窗口内按语言对自动合并为一次
+        批量请求，N条并发翻译只消耗一次HTTP往返。
+
         Args:
             text: 要翻译的文本
             source_lang: 源语言代码，默认'auto'
             target_lang: 目标语言代码，默认'zh-CN'
-            
+
         Returns:
             翻译结果字典
         """
-        data = {
-            'text': text,
-            'sourceLang': source_lang,
-            'targetLang': target_lang
-        }
-        
-        response = await self._request('POST', '/api/translate', data)
-        self.logger.debug(f"翻译完成: {response['data']}")
-        return response['data']
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+
+        key = (source_lang, target_lang)
+        pending = self._pending_translations.setdefault(key, [])
+        pending.append((text, future))
+
+        if len(pending) >= self._MAX_BATCH:
+            self._flush_translations(key)
+        elif len(pending) == 1:
+            loop.call_later(self._BATCH_WINDOW, self._flush_translations, key)
+
+        return await future
+
+    def _flush_translations(self, key) -> None:
+        """取出并发送指定语言对的待翻译队列"""
+        pending = self._pending_translations.pop(key, None)
+        if pending:
+            task = asyncio.ensure_future(self._run_translation_batch(key, pending))
+            # 事件循环只持任务的弱引用，保存强引用防止任务中途被回收
+            self._background_tasks.add(task)
+            task.add_done_callback(self._background_tasks.discard)
+
+    async def _run_translation_batch(self, key, pending) -> None:
+        """
+        执行合并后的翻译请求并按序号回填各调用方的future
+
+        Args:
+            key: (源语言, 目标语言)元组
+            pending: (文本, future)列表
+        """
+        source_lang, target_lang = key
+        try:
+            if len(pending) == 1:
+                # 只有一条时直接走单条接口，保持原有请求形态
+                text, future = pending[0]
+                data = {
+                    'text': text,
+                    'sourceLang': source_lang,
+                    'targetLang': target_lang
+                }
+                response = await self._request('POST', '/api/translate', data)
+                self.logger.debug(f"翻译完成: {response['data']}")
+                if not future.done():
+                    future.set_result(response['data'])
+                return
+
+            texts = [text for text, _ in pending]
+            batch = await self.batch_translate(texts, source_lang, target_lang)
+
+            for item in batch['results']:
+                _, future = pending[item['index']]
+                if future.done():
+                    continue
+                if item.get('success'):
+                    future.set_result({
+                        'original': item['original'],
+                        'translation': item['translation'],
+                        'sourceLang': source_lang,
+                        'targetLang': target_lang,
+                        'timestamp': batch.get('timestamp')
+                    })
+                else:
+                    future.set_exception(Exception(item.get('error', '翻译失败')))
+        except Exception as error:
+            for _, future in pending:
+                if not future.done():
+                    future.set_exception(error)
     
     async def batch_translate(self, texts: List[str], source_lang: str = 'auto',
                              target_lang: str = 'zh-CN') -> Dict[str, Any]:
@@ -120,49 +272,108 @@ class VRTranslateSDK:
         response = await self._request('POST', '/api/translate/batch', data)
         self.logger.debug(f"批量翻译完成: {response['data']}")
         return response['data']
+
+    async def batch_translate_many(self, texts: List[str], source_lang: str = 'auto',
+                                   target_lang: str = 'zh-CN', chunk: int = 100,
+                                   concurrency: int = 4) -> Dict[str, Any]:
+        """
+        超出单批上限的大批量翻译
+
+        将文本按chunk切分，在信号量限制下并发调用batch_translate，
+        然后合并各批结果并换算为全局序号。
+
+        Args:
+            texts: 要翻译的文本列表（数量不限）
+            source_lang: 源语言代码，默认'auto'
+            target_lang: 目标语言代码，默认'zh-CN'
+            chunk: 单批文本数量，最大100
+            concurrency: 同时在途的批次数
+
+        Returns:
+            与batch_translate相同结构的合并结果字典
+        """
+        if not isinstance(texts, list) or len(texts) == 0:
+            raise ValueError("texts must be a non-empty list")
+
+        chunk = min(chunk, 100)
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def _run(chunk_texts):
+            async with semaphore:
+                return await self.batch_translate(chunk_texts, source_lang, target_lang)
+
+        offsets = range(0, len(texts), chunk)
+        batches = await asyncio.gather(*(_run(texts[i:i + chunk]) for i in offsets))
+
+        merged = {
+            'total': 0,
+            'successful': 0,
+            'failed': 0,
+            'results': [],
+            'sourceLang': source_lang,
+            'targetLang': target_lang,
+            'timestamp': batches[-1].get('timestamp')
+        }
+        for offset, batch in zip(offsets, batches):
+            for item in batch['results']:
+                item['index'] += offset
+                merged['results'].append(item)
+            merged['total'] += batch['total']
+            merged['successful'] += batch['successful']
+            merged['failed'] += batch['failed']
+
+        return merged
     
-    async def ocr(self, image: Union[str, bytes], lang: str = 'auto') -> Dict[str, Any]:
+    async def ocr(self, image: Union[str, bytes], lang: str = 'auto',
+                  preprocess: bool = True, max_dim: int = 2400) -> Dict[str, Any]:
         """
         OCR识别图片文字
-        
+
         Args:
             image: Base64编码的图片字符串或字节数据
             lang: 识别语言，默认'auto'
-            
+            preprocess: 是否在上传前做灰度化/降采样预处理（需要OpenCV）
+            max_dim: 预处理时图片最长边的像素上限
+
         Returns:
             OCR识别结果字典
         """
         if isinstance(image, bytes):
-            image_data = base64.b64encode(image).decode('utf-8')
-            image_data = f"data:image/png;base64,{image_data}"
+            if preprocess:
+                image = self._preprocess_image(image, max_dim)
+            image_data = self._image_data_url(image)
         else:
             image_data = image
-        
+
         data = {
             'image': image_data,
             'lang': lang
         }
-        
+
         response = await self._request('POST', '/api/ocr', data)
         self.logger.debug(f"OCR识别完成: {response['data']}")
         return response['data']
     
     async def ocr_translate(self, image: Union[str, bytes], source_lang: str = 'auto',
-                           target_lang: str = 'zh-CN') -> Dict[str, Any]:
+                           target_lang: str = 'zh-CN',
+                           preprocess: bool = True, max_dim: int = 2400) -> Dict[str, Any]:
         """
         OCR识别后翻译
-        
+
         Args:
             image: Base64编码的图片字符串或字节数据
             source_lang: 源语言代码，默认'auto'
             target_lang: 目标语言代码，默认'zh-CN'
-            
+            preprocess: 是否在上传前做灰度化/降采样预处理（需要OpenCV）
+            max_dim: 预处理时图片最长边的像素上限
+
         Returns:
             OCR+翻译结果字典
         """
         if isinstance(image, bytes):
-            image_data = base64.b64encode(image).decode('utf-8')
-            image_data = f"data:image/png;base64,{image_data}"
+            if preprocess:
+                image = self._preprocess_image(image, max_dim)
+            image_data = self._image_data_url(image)
         else:
             image_data = image
         
@@ -178,23 +389,42 @@ class VRTranslateSDK:
     
     async def get_languages(self) -> Dict[str, Any]:
         """
-        获取支持的语言列表
-        
+        获取支持的语言列表（进程内缓存5分钟）
+
         Returns:
             语言列表字典
         """
-        response = await self._request('GET', '/api/languages')
-        return response['data']
-    
+        return await self._cached_request('/api/languages', self._LANGUAGES_TTL)
+
     async def get_stats(self) -> Dict[str, Any]:
         """
-        获取服务统计信息
-        
+        获取服务统计信息（进程内缓存5秒）
+
         Returns:
             统计信息字典
         """
-        response = await self._request('GET', '/api/stats')
-        return response['data']
+        return await self._cached_request('/api/stats', self._STATS_TTL)
+
+    async def _cached_request(self, path: str, ttl: float) -> Dict[str, Any]:
+        """
+        带TTL的进程内GET缓存，同一会话内的重复调用直接返回
+
+        Args:
+            path: API路径
+            ttl: 缓存有效期（秒）
+
+        Returns:
+            响应数据字典
+        """
+        cached = self._response_cache.get(path)
+        now = time.monotonic()
+        if cached and cached[0] > now:
+            return cached[1]
+
+        response = await self._request('GET', path)
+        data = response['data']
+        self._response_cache[path] = (now + ttl, data)
+        return data
     
     # ===============================
     # WebSocket方法
@@ -203,10 +433,16 @@ class VRTranslateSDK:
     async def connect_websocket(self) -> None:
         """连接WebSocket服务器"""
         try:
-            self.ws = await websockets.connect(self.config['websocket_url'])
+            self.ws = await websockets.connect(
+                self.config['websocket_url'],
+                compression=self.config['compression'],
+                max_size=2 ** 22
+            )
             self.logger.debug("WebSocket连接已建立")
-            
-            # 启动消息监听任务
+
+            # 启动消息监听和批量发送任务
+            self._send_q = asyncio.Queue()
+            self._writer_task = asyncio.create_task(self._writer_loop())
             asyncio.create_task(self._websocket_listener())
             
         except Exception as error:
@@ -215,6 +451,12 @@ class VRTranslateSDK:
     
     async def disconnect_websocket(self) -> None:
         """断开WebSocket连接"""
+        if self._writer_task:
+            # 先等队列清空，避免丢弃已入队但尚未上线的帧
+            await self._send_q.join()
+            self._writer_task.cancel()
+            self._writer_task = None
+            self._send_q = None
         if self.ws:
             await self.ws.close()
             self.ws = None
@@ -251,26 +493,35 @@ class VRTranslateSDK:
     def on_websocket_message(self, message_type: str, callback: Callable) -> None:
         """
         监听WebSocket消息
-        
+
+        回调在注册时按同步/协程分类，热路径分发无需逐条inspect。
+
         Args:
             message_type: 消息类型
-            callback: 回调函数
+            callback: 回调函数（普通函数或协程函数）
         """
-        if message_type not in self.ws_listeners:
-            self.ws_listeners[message_type] = []
-        self.ws_listeners[message_type].append(callback)
-    
+        # setdefault只做一次哈希查找，替代in检查+赋值+取值三次字典操作
+        sync_callbacks, async_callbacks = self.ws_listeners.setdefault(message_type, ([], []))
+        if asyncio.iscoroutinefunction(callback):
+            async_callbacks.append(callback)
+        else:
+            sync_callbacks.append(callback)
+
     def off_websocket_message(self, message_type: str, callback: Callable) -> None:
         """
         移除WebSocket消息监听器
-        
+
         Args:
             message_type: 消息类型
             callback: 回调函数
         """
-        if message_type in self.ws_listeners:
+        listeners = self.ws_listeners.get(message_type)
+        if not listeners:
+            return
+        for callbacks in listeners:
             try:
-                self.ws_listeners[message_type].remove(callback)
+                callbacks.remove(callback)
+                return
             except ValueError:
                 pass
     
@@ -278,48 +529,100 @@ class VRTranslateSDK:
     # 内部辅助方法
     # ===============================
     
+    @staticmethod
+    def _preprocess_image(image: bytes, max_dim: int = 2400) -> bytes:
+        """
+        OCR前的客户端预处理：灰度化并限制最长边
+
+        降采样的灰度JPEG能同时减少上传字节数和服务端OCR耗时，
+        识别精度基本不受影响。OpenCV未安装或解码失败时原样返回。
+
+        Args:
+            image: 原始图片字节数据
+            max_dim: 图片最长边的像素上限
+
+        Returns:
+            预处理后的JPEG字节数据
+        """
+        if cv2 is None:
+            return image
+
+        arr = cv2.imdecode(np.frombuffer(image, dtype=np.uint8), cv2.IMREAD_GRAYSCALE)
+        if arr is None:
+            return image
+
+        height, width = arr.shape[:2]
+        if max(height, width) > max_dim:
+            scale = max_dim / max(height, width)
+            arr = cv2.resize(arr, (int(width * scale), int(height * scale)),
+                             interpolation=cv2.INTER_AREA)
+
+        ok, buf = cv2.imencode('.jpg', arr, [int(cv2.IMWRITE_JPEG_QUALITY), 85])
+        if not ok:
+            return image
+        return buf.tobytes()
+
+    @staticmethod
+    def _image_data_url(image: bytes) -> str:
+        """
+        将图片字节编码为data URL，MIME类型按魔数识别
+
+        b2a_base64直接产出无换行结果，bytes拼接前缀后仅做一次ASCII解码。
+
+        Args:
+            image: 原始图片字节数据
+
+        Returns:
+            data URL字符串
+        """
+        mime = b'image/jpeg' if image[:3] == b'\xff\xd8\xff' else b'image/png'
+        return (b'data:' + mime + b';base64,'
+                + binascii.b2a_base64(image, newline=False)).decode('ascii')
+
     async def _request(self, method: str, path: str, data: Optional[Dict] = None) -> Dict[str, Any]:
         """
         发送HTTP请求
-        
+
         Args:
             method: HTTP方法
             path: API路径
             data: 请求数据
-            
+
         Returns:
             响应数据字典
         """
-        if not self.session:
-            self.session = aiohttp.ClientSession()
-        
-        url = f"{self.config['base_url']}{path}"
-        
+        client = self._ensure_client()
+
         # 重试机制
+        delay = self._BACKOFF_BASE
         for attempt in range(1, self.config['retries'] + 1):
             try:
-                timeout = aiohttp.ClientTimeout(total=self.config['timeout'])
-                
-                async with self.session.request(
-                    method, url, json=data, timeout=timeout
-                ) as response:
-                    
-                    if response.status != 200:
-                        raise aiohttp.ClientError(f"HTTP {response.status}: {response.reason}")
-                    
-                    result = await response.json()
-                    
-                    if not result.get('success', False):
-                        raise Exception(result.get('message', '请求失败'))
-                    
-                    return result
-                    
+                response = await client.request(method, path, json=data)
+
+                if response.status_code != 200:
+                    raise httpx.HTTPStatusError(
+                        f"HTTP {response.status_code}: {response.reason_phrase}",
+                        request=response.request, response=response
+                    )
+
+                result = _json_loads(response.content)
+
+                if not result.get('success', False):
+                    raise Exception(result.get('message', '请求失败'))
+
+                return result
+
             except Exception as error:
-                if attempt == self.config['retries']:
+                # 4xx客户端错误重试也不会成功，直接抛出
+                non_retryable = (isinstance(error, httpx.HTTPStatusError)
+                                 and error.response.status_code in self._NON_RETRYABLE_STATUS)
+                if non_retryable or attempt == self.config['retries']:
                     raise error
-                
+
                 self.logger.warning(f"请求失败，正在重试 {attempt}/{self.config['retries']}: {error}")
-                await asyncio.sleep(2 ** attempt)  # 指数退避
+                # 去相关抖动退避：封顶避免长尾等待，随机化打散各客户端的重试节奏
+                delay = min(self._BACKOFF_CAP, random.uniform(self._BACKOFF_BASE, delay * 3))
+                await asyncio.sleep(delay)
     
     async def _send_websocket_message(self, message_type: str, payload: Dict[str, Any]) -> None:
         """
@@ -333,31 +636,59 @@ class VRTranslateSDK:
             raise Exception("WebSocket未连接")
         
         self.request_id += 1
-        message = {
-            'type': message_type,
-            'payload': payload,
-            'id': self.request_id,
-            'timestamp': int(time.time() * 1000)
-        }
-        
-        await self.ws.send(json.dumps(message))
+        # 复用单个消息模板字典；序列化在入队前完成，之后改写模板是安全的
+        message = self._msg_template
+        message['type'] = message_type
+        message['payload'] = payload
+        message['id'] = self.request_id
+        message['timestamp'] = _now_ms()
+
+        # 序列化后入队，由后台写协程批量发送
+        self._send_q.put_nowait(_json_dumps(message))
         self.logger.debug(f"发送WebSocket消息: {message}")
     
-    async def _websocket_listener(self) -> None:
-        """WebSocket消息监听器"""
+    async def _writer_loop(self) -> None:
+        """后台发送协程：逐帧发送队列中的消息，调用方入队后即可继续执行"""
         try:
-            async for message_data in self.ws:
+            while True:
+                frame = await self._send_q.get()
                 try:
-                    message = json.loads(message_data)
-                    await self._handle_websocket_message(message)
-                except json.JSONDecodeError as error:
-                    self.logger.error(f"解析WebSocket消息失败: {error}")
-                except Exception as error:
-                    self.logger.error(f"处理WebSocket消息失败: {error}")
+                    # 服务端按单条消息解析，逐帧发送；不可合并为JSON数组帧
+                    await self.ws.send(frame)
+                finally:
+                    self._send_q.task_done()
+        except asyncio.CancelledError:
+            pass
         except websockets.exceptions.ConnectionClosed:
-            self.logger.debug("WebSocket连接已关闭")
+            self.logger.debug("WebSocket连接已关闭，发送协程退出")
         except Exception as error:
-            self.logger.error(f"WebSocket监听器错误: {error}")
+            self.logger.error(f"WebSocket发送协程错误: {error}")
+        finally:
+            # 协程退出时清空残留帧，保证disconnect里的join()不会悬挂
+            while not self._send_q.empty():
+                self._send_q.get_nowait()
+                self._send_q.task_done()
+
+    async def _websocket_listener(self) -> None:
+        """WebSocket消息监听器"""
+        while True:
+            try:
+                message_data = await self.ws.recv()
+            except websockets.exceptions.ConnectionClosed:
+                self.logger.debug("WebSocket连接已关闭")
+                break
+            except Exception as error:
+                self.logger.error(f"WebSocket监听器错误: {error}")
+                break
+
+            try:
+                # str和bytes帧都直接交给_json_loads，bytes无需先解码为str
+                message = _json_loads(message_data)
+                await self._handle_websocket_message(message)
+            except ValueError as error:
+                self.logger.error(f"解析WebSocket消息失败: {error}")
+            except Exception as error:
+                self.logger.error(f"处理WebSocket消息失败: {error}")
     
     async def _handle_websocket_message(self, message: Dict[str, Any]) -> None:
         """
@@ -369,15 +700,25 @@ class VRTranslateSDK:
         self.logger.debug(f"收到WebSocket消息: {message}")
         
         message_type = message.get('type')
-        if message_type in self.ws_listeners:
-            for callback in self.ws_listeners[message_type]:
-                try:
-                    if asyncio.iscoroutinefunction(callback):
-                        await callback(message)
-                    else:
-                        callback(message)
-                except Exception as error:
-                    self.logger.error(f"WebSocket消息处理错误: {error}")
+        listeners = self.ws_listeners.get(message_type)
+        if not listeners:
+            return
+
+        sync_callbacks, async_callbacks = listeners
+        for callback in sync_callbacks:
+            try:
+                callback(message)
+            except Exception as error:
+                self.logger.error(f"WebSocket消息处理错误: {error}")
+
+        if async_callbacks:
+            results = await asyncio.gather(
+                *(callback(message) for callback in async_callbacks),
+                return_exceptions=True
+            )
+            for result in results:
+                if isinstance(result, Exception):
+                    self.logger.error(f"WebSocket消息处理错误: {result}")
 
 
 # 使用示例
@@ -422,7 +763,7 @@ async def example():
             await sdk.send_gaze_data({
                 'x': 100,
                 'y': 200,
-                'timestamp': int(time.time() * 1000),
+                'timestamp': _now_ms(),
                 'confidence': 0.95
             })
             
@@ -442,4 +783,5 @@ async def example():
 
 if __name__ == "__main__":
     # 运行示例
+    VRTranslateSDK.install_uvloop()
     asyncio.run(example())
\ No newline at end of file